@@ -1,6 +1,81 @@
+import functools
+import os
+from dataclasses import dataclass
 from pathlib import Path
+from typing import Any, Callable, Mapping
 
-from pydantic import BaseModel, ConfigDict, Field, ValidationError, field_validator
+# Logging levels accepted for LoggerConfig.log_level, built once at import.
+_ALLOWED_LEVELS = frozenset({"DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"})
+_ALLOWED_STR = ", ".join(sorted(_ALLOWED_LEVELS))
+
+# Expected type (and its description for error messages) for each setting.
+_FIELD_TYPES: tuple[tuple[str, type | tuple[type, ...], str], ...] = (
+    ("log_dir", (str, os.PathLike), "a path"),
+    ("log_level", str, "a string"),
+    ("log_verbose", bool, "a boolean"),
+    ("max_bytes", int, "an integer"),
+    ("backup_count", int, "an integer"),
+    ("log_json", bool, "a boolean"),
+)
+
+_TRUE_VALUES = frozenset({"1", "true", "yes", "on"})
+_FALSE_VALUES = frozenset({"0", "false", "no", "off"})
+
+
+def _parse_bool(v: str) -> bool:
+    """Parse an environment variable value as a boolean.
+
+    Args:
+        v (str): The raw value, e.g. 'true', '0' or 'off'.
+
+    Returns:
+        bool: The parsed value.
+
+    Raises:
+        ValueError: If the value is not a recognized boolean.
+    """
+    v = v.lower()
+    if v in _TRUE_VALUES:
+        return True
+    if v in _FALSE_VALUES:
+        return False
+    raise ValueError(
+        f"expected one of {', '.join(sorted(_TRUE_VALUES | _FALSE_VALUES))}"
+    )
+
+
+# Environment variable, setting and parser used by LoggerConfig.from_env.
+_ENV_SETTINGS: tuple[tuple[str, str, Callable[[str], Any]], ...] = (
+    ("LOG_DIR", "log_dir", Path),
+    ("LOG_LEVEL", "log_level", str),
+    ("LOG_VERBOSE", "log_verbose", _parse_bool),
+    ("LOG_MAX_BYTES", "max_bytes", int),
+    ("LOG_BACKUP_COUNT", "backup_count", int),
+    ("LOG_JSON", "log_json", _parse_bool),
+)
+
+
+def _check_types(values: Mapping[str, Any]) -> None:
+    """Check that each setting has the type listed in _FIELD_TYPES.
+
+    Args:
+        values (Mapping[str, Any]): The settings, by field name.
+
+    Raises:
+        LoggerConfigError: If a setting has the wrong type.
+    """
+    for name, expected, description in _FIELD_TYPES:
+        value = values[name]
+        # bool is a subclass of int, but True is not a valid byte count.
+        if not isinstance(value, expected) or (
+            expected is int and isinstance(value, bool)
+        ):
+            raise LoggerConfigError(
+                "Invalid configuration",
+                error=TypeError(
+                    f"{name} must be {description}, got {type(value).__name__}"
+                ),
+            )
 
 
 class LoggerConfigError(Exception):
@@ -33,8 +108,9 @@ class LoggerConfigError(Exception):
         return f"LoggerConfigError(message={self.message!r}, error={self.error!r})"
 
 
-class LoggerConfig(BaseModel):
-    """Pydantic model for logger configuration.
+@dataclass(frozen=True, slots=True, kw_only=True)
+class LoggerConfig:
+    """Immutable logger configuration, validated when it is constructed.
 
     Attributes:
         log_dir (Path): Directory where log files will be stored.
@@ -42,23 +118,32 @@ class LoggerConfig(BaseModel):
         log_verbose (bool): Whether verbose logging is enabled.
         max_bytes (int): Maximum size (in bytes) for a log file before rotation.
         backup_count (int): Number of backup log files to keep.
+        log_json (bool): Whether the log file is written as one JSON object per line.
     """
 
-    model_config = ConfigDict(
-        extra="forbid",
-        validate_assignment=True,
-        str_strip_whitespace=True,
-        str_min_length=1,
-    )
-
     log_dir: Path
     log_level: str
     log_verbose: bool
-    max_bytes: int = Field(default=1 * 1024 * 1024)  # 1MB by default.
-    backup_count: int = Field(default=0)
+    max_bytes: int = 1 * 1024 * 1024  # 1MB by default.
+    backup_count: int = 0
+    log_json: bool = False
+
+    def __post_init__(self) -> None:
+        """Validate the settings, converting log_dir to a Path and uppercasing log_level.
+
+        Raises:
+            LoggerConfigError: If a setting has the wrong type, the logging level is not
+                one of the allowed values, or the log directory cannot be created.
+        """
+        _check_types({name: getattr(self, name) for name, _, _ in _FIELD_TYPES})
+        # The instance is frozen, so normalized values are set through object.
+        object.__setattr__(self, "log_level", self.check_log_level(self.log_level))
+        object.__setattr__(
+            self, "log_dir", self.ensure_log_dir_exists(Path(self.log_dir))
+        )
 
-    @field_validator("log_dir")
-    def ensure_log_dir_exists(cls, v: Path) -> Path:
+    @staticmethod
+    def ensure_log_dir_exists(v: Path) -> Path:
         """Ensure the log directory exists; create it if it doesn't.
 
         Args:
@@ -77,8 +162,8 @@ class LoggerConfig(BaseModel):
                 error=e,
             )
 
-    @field_validator("log_level")
-    def check_log_level(cls, v: str) -> str:
+    @staticmethod
+    def check_log_level(v: str) -> str:
         """Validate that log_level is one of the allowed values.
 
         Args:
@@ -90,21 +175,176 @@ class LoggerConfig(BaseModel):
         Raises:
             LoggerConfigError: If the logging level is not one of the allowed values.
         """
-        allowed = {"DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"}
-        v = v.upper()
-        if v not in allowed:
+        v = v.strip().upper()
+        if v not in _ALLOWED_LEVELS:
             raise LoggerConfigError(
                 "LoggerConfig validation failed for log_level",
-                error=ValueError(f"log_level must be one of {', '.join(allowed)}"),
+                error=ValueError(f"log_level must be one of {_ALLOWED_STR}"),
             )
         return v
 
-    def __init__(self, **data):
-        """
-        Initializes the configuration model with the provided data. If any validation error occurs
-        during initialization, the Pydantic ValidationError is caught and re-raised as a LoggerConfigError.
+    @classmethod
+    def build(cls, **data: Any) -> "LoggerConfig":
+        """Build a configuration from keyword data such as a parsed settings mapping.
+
+        Calling the class directly raises TypeError for unknown or missing settings;
+        this reports them as a LoggerConfigError like any other invalid value.
+
+        Args:
+            **data: The configuration settings.
+
+        Returns:
+            LoggerConfig: The validated configuration.
+
+        Raises:
+            LoggerConfigError: If the configuration is invalid.
         """
         try:
-            super().__init__(**data)
-        except ValidationError as e:
-            raise LoggerConfigError(f"Invalid configuration: {e}") from e
+            return cls(**data)
+        except TypeError as e:
+            raise LoggerConfigError("Invalid configuration", error=e) from e
+
+    @classmethod
+    def from_env(cls, env: Mapping[str, str] | None = None) -> "LoggerConfig":
+        """Build a configuration from environment variables.
+
+        Reads LOG_DIR, LOG_LEVEL and LOG_VERBOSE, and optionally LOG_MAX_BYTES,
+        LOG_BACKUP_COUNT and LOG_JSON. LOG_VERBOSE and LOG_JSON accept 1/0,
+        true/false, yes/no or on/off.
+
+        Args:
+            env (Mapping[str, str], optional): The variables to read; defaults to os.environ.
+
+        Returns:
+            LoggerConfig: The validated configuration.
+
+        Raises:
+            LoggerConfigError: If a variable is missing or cannot be parsed, or the
+                resulting configuration is invalid.
+        """
+        if env is None:
+            env = os.environ
+        data: dict[str, Any] = {}
+        for var, name, parse in _ENV_SETTINGS:
+            raw = env.get(var)
+            if raw is None:
+                continue
+            try:
+                data[name] = parse(raw.strip())
+            except ValueError as e:
+                raise LoggerConfigError(
+                    f"LoggerConfig validation failed for {var}", error=e
+                ) from e
+        return cls.build(**data)
+
+    @classmethod
+    def from_trusted(
+        cls,
+        *,
+        log_dir: Path | str,
+        log_level: str,
+        log_verbose: bool,
+        max_bytes: int = 1 * 1024 * 1024,
+        backup_count: int = 0,
+        log_json: bool = False,
+    ) -> "LoggerConfig":
+        """Build a configuration from values that have already been validated.
+
+        Validation is now a handful of type checks, so this is equivalent to
+        calling the class directly; it is kept for existing callers.
+
+        Args:
+            log_dir (Path | str): Directory where log files will be stored.
+            log_level (str): Logging level (e.g., 'DEBUG', 'INFO').
+            log_verbose (bool): Whether verbose logging is enabled.
+            max_bytes (int): Maximum size (in bytes) for a log file before rotation.
+            backup_count (int): Number of backup log files to keep.
+            log_json (bool): Whether the log file is written as JSON lines.
+
+        Returns:
+            LoggerConfig: The constructed configuration.
+
+        Raises:
+            LoggerConfigError: If the configuration is invalid.
+        """
+        return cls(
+            log_dir=Path(log_dir),
+            log_level=log_level,
+            log_verbose=log_verbose,
+            max_bytes=max_bytes,
+            backup_count=backup_count,
+            log_json=log_json,
+        )
+
+    @classmethod
+    def get(
+        cls,
+        *,
+        log_dir: Path | str,
+        log_level: str,
+        log_verbose: bool,
+        max_bytes: int = 1 * 1024 * 1024,
+        backup_count: int = 0,
+        log_json: bool = False,
+    ) -> "LoggerConfig":
+        """Return a shared configuration for these settings, validating it only once.
+
+        Configurations are cached by their settings, so repeated calls with the same
+        values return the same instance without re-running validation. The log
+        directory is only created on the first call.
+
+        Args:
+            log_dir (Path | str): Directory where log files will be stored.
+            log_level (str): Logging level (e.g., 'DEBUG', 'INFO').
+            log_verbose (bool): Whether verbose logging is enabled.
+            max_bytes (int): Maximum size (in bytes) for a log file before rotation.
+            backup_count (int): Number of backup log files to keep.
+            log_json (bool): Whether the log file is written as JSON lines.
+
+        Returns:
+            LoggerConfig: The shared configuration.
+
+        Raises:
+            LoggerConfigError: If the configuration is invalid.
+        """
+        # Check types before the cache lookup, so that invalid values are never
+        # coerced into a cache key (e.g. str(None)) or matched to a cached entry.
+        _check_types(
+            {
+                "log_dir": log_dir,
+                "log_level": log_level,
+                "log_verbose": log_verbose,
+                "max_bytes": max_bytes,
+                "backup_count": backup_count,
+                "log_json": log_json,
+            }
+        )
+        return _build(
+            os.fspath(log_dir),
+            log_level,
+            log_verbose,
+            max_bytes,
+            backup_count,
+            log_json,
+        )
+
+
+# typed=True keeps True and 1 apart as cache keys.
+@functools.lru_cache(maxsize=32, typed=True)
+def _build(
+    log_dir: str,
+    log_level: str,
+    log_verbose: bool,
+    max_bytes: int,
+    backup_count: int,
+    log_json: bool,
+) -> LoggerConfig:
+    """Build a LoggerConfig and cache it by its settings (see LoggerConfig.get)."""
+    return LoggerConfig(
+        log_dir=Path(log_dir),
+        log_level=log_level,
+        log_verbose=log_verbose,
+        max_bytes=max_bytes,
+        backup_count=backup_count,
+        log_json=log_json,
+    )
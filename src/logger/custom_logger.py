@@ -1,12 +1,140 @@
+import atexit
+import copy
+import functools
+import io
+import locale
 import logging
+import os
+import queue
+import stat
+import threading
+import time
+import weakref
 from datetime import datetime
-from logging.handlers import RotatingFileHandler
-from typing import Any
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
+from typing import TYPE_CHECKING, Any, Callable, Literal, Mapping, cast
 
-from logger.config import LoggerConfig
+# Only needed for annotations; importing the formatters and handlers does not
+# load the configuration module.
+if TYPE_CHECKING:
+    from logger.config import LoggerConfig
 
+_COLORS = {
+    "DEBUG": "\033[92m",  # Green
+    "INFO": "\033[94m",  # Blue
+    "WARNING": "\033[93m",  # Yellow
+    "ERROR": "\033[91m",  # Red
+    "CRITICAL": "\033[95m",  # Magenta
+}
+_RESET = "\033[0m"
+# Fully colored level names, built once so formatting a record is a lookup.
+_COLORED_LEVELNAMES = {
+    level: f"{color}{level}{_RESET}" for level, color in _COLORS.items()
+}
 
-class ColoredFormatter(logging.Formatter):
+
+class FastFormatter(logging.Formatter):
+    """A logging formatter that substitutes %-style record fields directly.
+
+    `logging.Formatter` sends every record through its style object, which
+    checks for default values before applying the format string. For %-style
+    format strings without defaults, this formatter validates the format string
+    once at construction and then applies it to the record's attributes in a
+    single `%` operation. Other styles, and formats with defaults, are applied
+    by `logging.Formatter`.
+
+    Args:
+        fmt (str, optional): The format string for log messages.
+        datefmt (str, optional): The `time.strftime` format for `asctime`.
+        style (str): The format string style: '%', '{' or '$'.
+        validate (bool): Whether to check the format string against the style.
+        defaults (dict[str, Any], optional): Default values for custom fields.
+    """
+
+    def __init__(
+        self,
+        fmt: str | None = None,
+        datefmt: str | None = None,
+        style: Literal["%", "{", "$"] = "%",
+        validate: bool = True,
+        *,
+        defaults: Mapping[str, Any] | None = None,
+    ) -> None:
+        super().__init__(fmt, datefmt, style, validate, defaults=defaults)
+        self._fmt_str = self._style._fmt
+        # The other styles subclass PercentStyle, so check the exact type.
+        self._direct = type(self._style) is logging.PercentStyle and not defaults
+        # The format string never changes, so only scan it for asctime once.
+        self._uses_time = self._style.usesTime()
+        # (second, datefmt, formatted time) of the last record, swapped as one tuple
+        # so threads sharing the formatter never see a partial update.
+        self._time_cache: tuple[int, str | None, str] = (-1, None, "")
+
+    def usesTime(self) -> bool:
+        """Return whether the format string uses the record's creation time.
+
+        Returns:
+            bool: True if the format string contains `%(asctime)`.
+        """
+        return self._uses_time
+
+    def formatTime(self, record: logging.LogRecord, datefmt: str | None = None) -> str:
+        """Format the record's creation time, reusing the result within a second.
+
+        `time.strftime` has no sub-second directives, so its output only changes once
+        per second; only the millisecond suffix is computed for every record.
+
+        Args:
+            record (logging.LogRecord): The log record whose time is formatted.
+            datefmt (str, optional): The `time.strftime` format to use.
+
+        Returns:
+            str: The formatted creation time.
+        """
+        second = int(record.created)
+        cached_second, cached_datefmt, s = self._time_cache
+        if cached_second != second or cached_datefmt != datefmt:
+            ct = self.converter(record.created)
+            s = time.strftime(datefmt or self.default_time_format, ct)
+            self._time_cache = (second, datefmt, s)
+        if datefmt or not self.default_msec_format:
+            return s
+        return self.default_msec_format % (s, record.msecs)
+
+    def format(self, record: logging.LogRecord) -> str:
+        """Format the record, skipping the traceback handling when there is none.
+
+        Records with exception or stack information, and formatters that do not
+        apply the format string directly, are formatted by `logging.Formatter.format`.
+
+        Args:
+            record (logging.LogRecord): The log record to be formatted.
+
+        Returns:
+            str: The formatted log message.
+        """
+        if not self._direct or record.exc_info or record.exc_text or record.stack_info:
+            return super().format(record)
+        record.message = record.getMessage()
+        if self._uses_time:
+            record.asctime = self.formatTime(record, self.datefmt)
+        return self._fmt_str % record.__dict__
+
+    def formatMessage(self, record: logging.LogRecord) -> str:
+        """Apply the format string to the record's attributes.
+
+        Args:
+            record (logging.LogRecord): The log record to be formatted.
+
+        Returns:
+            str: The formatted log message.
+        """
+        if not self._direct:
+            return super().formatMessage(record)
+        return self._fmt_str % record.__dict__
+
+
+class ColoredFormatter(FastFormatter):
     """A custom logging formatter that adds ANSI color codes to log level names.
 
     This formatter enhances log messages by inserting color codes around the log level
@@ -14,44 +142,369 @@ class ColoredFormatter(logging.Formatter):
     visual cues can help in quickly identifying log messages of different levels.
     """
 
-    COLORS = {
-        "DEBUG": "\033[92m",  # Green
-        "INFO": "\033[94m",  # Blue
-        "WARNING": "\033[93m",  # Yellow
-        "ERROR": "\033[91m",  # Red
-        "CRITICAL": "\033[95m",  # Magenta
-    }
-    RESET = "\033[0m"
+    COLORS = _COLORS
+    RESET = _RESET
 
     def format(self, record: Any) -> str:
         """Format the log record by adding color to the log level name.
 
+        Level names without a color are left uncolored.
+
         Args:
             record (Any): The log record to be formatted.
 
         Returns:
             str: The formatted log message with the colored log level name.
         """
-        levelname = record.levelname
-        # Remove any stray reset codes and then get the proper color.
-        levelname_stripped = levelname.strip(self.RESET)
-        log_color = self.COLORS.get(levelname_stripped, self.RESET)
-        record.levelname_colored = f"{log_color}{levelname_stripped}{self.RESET}"
+        record.levelname_colored = _COLORED_LEVELNAMES.get(
+            record.levelname, record.levelname
+        )
         return super().format(record)
 
 
+def _load_json_dumps() -> Callable[[dict[str, Any]], str]:
+    """Import a JSON serializer, preferring orjson when it is installed.
+
+    The import happens on first use so that loggers without JSON output never
+    load a JSON library.
+
+    Returns:
+        Callable[[dict[str, Any]], str]: A function returning compact JSON for a dict.
+    """
+    import json
+
+    json_dumps = functools.partial(
+        json.dumps, ensure_ascii=False, separators=(",", ":")
+    )
+    try:
+        import orjson
+    except ImportError:  # orjson is optional; fall back to the standard library.
+        return json_dumps
+
+    def dumps(obj: dict[str, Any]) -> str:
+        """Serialize `obj` with orjson, which returns UTF-8 bytes.
+
+        orjson rejects strings that are not valid UTF-8, such as lone surrogates;
+        those records are serialized with the standard library instead, and the
+        file handler replaces the unencodable characters.
+        """
+        try:
+            return orjson.dumps(obj).decode("utf-8")
+        except TypeError:
+            return json_dumps(obj)
+
+    return dumps
+
+
+class StructuredJsonFormatter(logging.Formatter):
+    """A logging formatter that renders each record as a single-line JSON object.
+
+    The object has the keys `ts` (creation time as a Unix timestamp), `lvl`, `name`,
+    `line` and `msg`, plus `exc` and `stack` when the record carries exception or
+    stack information. orjson is used for serialization when it is installed.
+    """
+
+    def __init__(self) -> None:
+        super().__init__()
+        self._dumps = _load_json_dumps()
+
+    def format(self, record: logging.LogRecord) -> str:
+        """Format the log record as a JSON object.
+
+        Args:
+            record (logging.LogRecord): The log record to be formatted.
+
+        Returns:
+            str: The JSON-encoded record.
+        """
+        data: dict[str, Any] = {
+            "ts": record.created,
+            "lvl": record.levelname,
+            "name": record.name,
+            "line": record.lineno,
+            "msg": record.getMessage(),
+        }
+        if record.exc_info and not record.exc_text:
+            record.exc_text = self.formatException(record.exc_info)
+        if record.exc_text:
+            data["exc"] = record.exc_text
+        if record.stack_info:
+            data["stack"] = self.formatStack(record.stack_info)
+        return self._dumps(data)
+
+
+# Record layout shared by the console and file formatters.
+_FORMAT = "%(asctime)s [{level}] %(name)s:%(lineno)d: %(message)s"
+
+
+@functools.cache
+def _build_formatters(verbose: bool) -> tuple[ColoredFormatter, FastFormatter]:
+    """Return the shared console and file formatters for a verbosity setting.
+
+    Formatters hold no per-logger state, so every CustomLogger with the same
+    verbosity shares these.
+
+    Args:
+        verbose (bool): The logger's verbosity; both settings currently use the
+            same layout.
+
+    Returns:
+        tuple[ColoredFormatter, FastFormatter]: The console and file formatters.
+    """
+    return (
+        ColoredFormatter(_FORMAT.format(level="%(levelname_colored)s")),
+        FastFormatter(_FORMAT.format(level="%(levelname)s")),
+    )
+
+
+@functools.cache
+def _json_formatter() -> StructuredJsonFormatter:
+    """Return the shared JSON formatter, created only when a logger needs it."""
+    return StructuredJsonFormatter()
+
+
+# Renders tracebacks for records handed to the listener thread.
+_EXC_FORMATTER = logging.Formatter()
+
+
+class _RecordQueueHandler(QueueHandler):
+    """A QueueHandler that keeps exception and stack text apart from the message.
+
+    The stock `QueueHandler.prepare` formats the record and folds any traceback into
+    `msg`, so formatters on the listener side (such as the JSON formatter) can no
+    longer tell the two apart.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        """Return a copy of the record that is safe to hand to another thread.
+
+        The message is merged with its arguments, and exc_info is rendered into
+        exc_text and dropped, since tracebacks cannot be pickled or shared safely.
+        exc_text and stack_info are kept for the formatter.
+
+        Args:
+            record (logging.LogRecord): The log record to be enqueued.
+
+        Returns:
+            logging.LogRecord: The prepared copy of the record.
+        """
+        record = copy.copy(record)
+        record.message = record.getMessage()
+        record.msg = record.message
+        record.args = None
+        if record.exc_info:
+            if not record.exc_text:
+                record.exc_text = _EXC_FORMATTER.formatException(record.exc_info)
+            record.exc_info = None
+        return record
+
+
+def _is_tty(stream: Any) -> bool:
+    """Return whether the stream is an interactive terminal.
+
+    Args:
+        stream (Any): The stream to check; may be None or lack `isatty`.
+
+    Returns:
+        bool: True if the stream reports being a TTY.
+    """
+    isatty = getattr(stream, "isatty", None)
+    try:
+        return bool(isatty and isatty())
+    except ValueError:  # The stream has been closed.
+        return False
+
+
+class BufferedRotatingFileHandler(RotatingFileHandler):
+    """A RotatingFileHandler that buffers writes instead of flushing every record.
+
+    Records are written into a `buffer_size` buffer that is flushed when it fills,
+    when a record at `flush_level` or above is emitted, every `flush_interval`
+    seconds, and when the handler is closed. The file is opened in binary mode and
+    each record is encoded once, so writes skip the text I/O layer. The current
+    file size is tracked in memory, so deciding whether to roll over does not touch
+    the file system. Lines end with the terminator as is, without newline
+    translation.
+
+    Args:
+        filename (str): Path of the log file.
+        mode (str): File open mode.
+        maxBytes (int): Maximum size (in bytes) for the file before rotation; 0 disables rotation.
+        backupCount (int): Number of backup log files to keep.
+        encoding (str, optional): Encoding used for the log file.
+        delay (bool): Whether to defer opening the file until the first record.
+        errors (str, optional): How encoding errors are handled.
+        flush_interval (float, optional): Seconds between periodic flushes; None disables them.
+    """
+
+    buffer_size = 64 * 1024
+    flush_level = logging.ERROR
+
+    def __init__(
+        self,
+        filename: str,
+        mode: str = "a",
+        maxBytes: int = 0,
+        backupCount: int = 0,
+        encoding: str | None = None,
+        delay: bool = False,
+        errors: str | None = None,
+        flush_interval: float | None = 30.0,
+    ) -> None:
+        # _open() runs inside the base initializer and sets these.
+        self._size = 0
+        self._rotatable = True
+        super().__init__(
+            filename,
+            mode=mode,
+            maxBytes=maxBytes,
+            backupCount=backupCount,
+            encoding=encoding,
+            delay=delay,
+            errors=errors,
+        )
+        # "locale" is only understood by text streams; resolve it for str.encode.
+        if self.encoding is None or self.encoding == "locale":
+            self._encoding = locale.getpreferredencoding(False)
+        else:
+            self._encoding = self.encoding
+        self._errors = self.errors or "strict"
+        self.flush_interval = flush_interval
+        self._timer: threading.Timer | None = None
+        if flush_interval:
+            self._schedule_flush(flush_interval)
+
+    def _open(self) -> Any:
+        """Open the log file in binary mode with a large write buffer.
+
+        Also records the file's current size and whether it may be rotated.
+
+        Returns:
+            io.BufferedWriter: The opened file.
+        """
+        mode = self.mode if "b" in self.mode else self.mode + "b"
+        # The handler keeps its own reference to open, which still works while the
+        # interpreter is shutting down.
+        open_func = self._builtin_open  # type: ignore[attr-defined]
+        stream = open_func(self.baseFilename, mode, buffering=self.buffer_size)
+        st = os.fstat(stream.fileno())
+        self._size = st.st_size
+        # See bpo-45401: never roll over anything other than regular files.
+        self._rotatable = stat.S_ISREG(st.st_mode)
+        return stream
+
+    def shouldRollover(self, record: logging.LogRecord) -> int:
+        """Determine whether writing the record would take the file past maxBytes.
+
+        Uses the in-memory file size rather than seeking or stat-ing the file.
+
+        Args:
+            record (logging.LogRecord): The log record about to be written.
+
+        Returns:
+            int: 1 if the file should be rolled over first, otherwise 0.
+        """
+        if self.stream is None:
+            if self._closed:  # type: ignore[attr-defined]
+                return 0
+            self.stream = self._open()
+        return int(self._needs_rollover(len(self._encode(record))))
+
+    def _encode(self, record: logging.LogRecord) -> bytes:
+        """Format the record and encode it as a line of the log file."""
+        return (self.format(record) + self.terminator).encode(
+            self._encoding, self._errors
+        )
+
+    def _needs_rollover(self, n: int) -> bool:
+        """Return whether writing n more bytes would take the file past maxBytes."""
+        return self._rotatable and 0 < self.maxBytes <= self._size + n
+
+    def emit(self, record: logging.LogRecord) -> None:
+        """Write the record to the buffer, rolling the file over first if needed.
+
+        Records emitted after the handler has been closed are dropped.
+
+        Args:
+            record (logging.LogRecord): The log record to be written.
+        """
+        try:
+            data = self._encode(record)
+            if self.stream is None:
+                # Don't reopen the file once the handler has been closed.
+                if self._closed:  # type: ignore[attr-defined]
+                    return
+                self.stream = self._open()
+            if self._needs_rollover(len(data)):
+                self.doRollover()
+                if self.stream is None:
+                    self.stream = self._open()
+            stream = cast(io.BufferedWriter, self.stream)
+            stream.write(data)
+            self._size += len(data)
+            if record.levelno >= self.flush_level:
+                stream.flush()
+        except RecursionError:
+            raise
+        except Exception:
+            self.handleError(record)
+
+    def close(self) -> None:
+        """Cancel the periodic flush, then flush and close the file."""
+        self.acquire()
+        try:
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+        finally:
+            self.release()
+        super().close()
+
+    def _at_fork_reinit(self) -> None:
+        """Reset the lock in a forked child and restart its periodic flush.
+
+        `logging` calls this for every handler after a fork; the timer thread
+        does not survive the fork.
+        """
+        super()._at_fork_reinit()  # type: ignore[misc]
+        if self._timer is not None and self.flush_interval:
+            self._schedule_flush(self.flush_interval)
+
+    def _schedule_flush(self, interval: float) -> None:
+        """Start the timer for the next periodic flush."""
+        self._timer = threading.Timer(interval, self._periodic_flush, args=(interval,))
+        self._timer.daemon = True
+        self._timer.start()
+
+    def _periodic_flush(self, interval: float) -> None:
+        """Flush the buffer and reschedule unless the handler has been closed."""
+        self.flush()
+        self.acquire()
+        try:
+            if self._timer is not None:
+                self._schedule_flush(interval)
+        finally:
+            self.release()
+
+
 class CustomLogger(logging.Logger):
-    """CustomLogger is a subclass of logging.Logger that configures itself using a Pydantic LoggerConfig.
+    """CustomLogger is a subclass of logging.Logger that configures itself using a LoggerConfig.
 
-    This logger loads its configuration from environment variables via the LoggerConfig model,
-    which validates settings such as log directory, log level, verbosity, and file rotation parameters.
-    It then attaches a console handler (with color-coded log levels) and a rotating file handler to itself.
+    This logger takes its configuration from a LoggerConfig, which validates settings such
+    as log directory, log level, verbosity, and file rotation parameters.
+    It then attaches a console handler (with color-coded log levels when writing to a
+    terminal) to itself and writes to a buffered rotating log file from a background
+    thread fed through a queue, so logging calls never wait on disk I/O. Call `flush()`
+    to wait for queued records to reach the file and `close()` to stop the background
+    thread; `close()` also runs at interpreter exit.
+    The two handlers are available as `console_handler` and `file_handler`.
 
     Args:
         name (str): The name of the logger instance.
+        cfg (LoggerConfig): The logger configuration.
     """
 
-    def __init__(self, name: str, cfg: LoggerConfig) -> None:
+    def __init__(self, name: str, cfg: "LoggerConfig") -> None:
 
         # Convert the log level string (already validated) to its numeric value.
         self.log_level = logging._nameToLevel.get(cfg.log_level, logging.INFO)
@@ -60,9 +513,15 @@ class CustomLogger(logging.Logger):
         self.verbose = cfg.log_verbose
         self.max_bytes = cfg.max_bytes
         self.backup_count = cfg.backup_count
+        self.log_json = cfg.log_json
 
         # Initialize the base Logger with the proper level.
         super().__init__(name, level=self.log_level)
+        # Records below this level are dropped by the level methods before any
+        # call into logging.Logger; kept in sync with the level by setLevel. Records
+        # at or above it still go through isEnabledFor (logging.disable, manager
+        # state) and are passed lazily to _log, as logging.Logger does.
+        self._min_level = self.level
 
         # Set up the console and file handlers on this logger instance.
         self._setup_logging()
@@ -70,33 +529,212 @@ class CustomLogger(logging.Logger):
         # Prevent log messages from propagating to the root logger (avoids duplicates).
         self.propagate = False
 
+    def setLevel(self, level: int | str) -> None:
+        """Set the logging level of this logger.
+
+        Args:
+            level (int | str): The new logging level.
+        """
+        super().setLevel(level)
+        self._min_level = self.level
+
+    def debug(self, msg: object, *args: object, **kwargs: Any) -> None:
+        """Log at DEBUG level, returning early below this logger's level."""
+        if logging.DEBUG < self._min_level:
+            return
+        if self.isEnabledFor(logging.DEBUG):
+            kwargs["stacklevel"] = kwargs.get("stacklevel", 1) + 1
+            self._log(logging.DEBUG, msg, args, **kwargs)
+
+    def info(self, msg: object, *args: object, **kwargs: Any) -> None:
+        """Log at INFO level, returning early below this logger's level."""
+        if logging.INFO < self._min_level:
+            return
+        if self.isEnabledFor(logging.INFO):
+            kwargs["stacklevel"] = kwargs.get("stacklevel", 1) + 1
+            self._log(logging.INFO, msg, args, **kwargs)
+
+    def warning(self, msg: object, *args: object, **kwargs: Any) -> None:
+        """Log at WARNING level, returning early below this logger's level."""
+        if logging.WARNING < self._min_level:
+            return
+        if self.isEnabledFor(logging.WARNING):
+            kwargs["stacklevel"] = kwargs.get("stacklevel", 1) + 1
+            self._log(logging.WARNING, msg, args, **kwargs)
+
+    def error(self, msg: object, *args: object, **kwargs: Any) -> None:
+        """Log at ERROR level, returning early below this logger's level."""
+        if logging.ERROR < self._min_level:
+            return
+        if self.isEnabledFor(logging.ERROR):
+            kwargs["stacklevel"] = kwargs.get("stacklevel", 1) + 1
+            self._log(logging.ERROR, msg, args, **kwargs)
+
+    def critical(self, msg: object, *args: object, **kwargs: Any) -> None:
+        """Log at CRITICAL level, returning early below this logger's level."""
+        if logging.CRITICAL < self._min_level:
+            return
+        if self.isEnabledFor(logging.CRITICAL):
+            kwargs["stacklevel"] = kwargs.get("stacklevel", 1) + 1
+            self._log(logging.CRITICAL, msg, args, **kwargs)
+
     def _setup_logging(self) -> None:
         """Configure this logger with console and rotating file handlers."""
-        # Formatter for console logs (with colors).
-        console_formatter = ColoredFormatter(
-            "%(asctime)s [%(levelname_colored)s] %(name)s:%(lineno)d: %(message)s"
-        )
-        # Standard formatter for file logs.
-        file_formatter = logging.Formatter(
-            "%(asctime)s [%(levelname)s] %(name)s:%(lineno)d: %(message)s"
-        )
-
         # Create and configure the console handler.
+        colored_formatter, file_formatter = _build_formatters(self.verbose)
         console_handler = logging.StreamHandler()
         console_handler.setLevel(self.log_level)
-        console_handler.setFormatter(console_formatter)
+        # Color codes are only useful on a terminal; redirected output (CI logs,
+        # files, pipes) gets the plain layout instead.
+        console_handler.setFormatter(
+            colored_formatter if _is_tty(console_handler.stream) else file_formatter
+        )
 
-        # Create and configure the rotating file handler.
-        file_handler = RotatingFileHandler(
+        # Create and configure the buffered rotating file handler.
+        file_handler = BufferedRotatingFileHandler(
             filename=str(self.log_file),
             mode="a",
             maxBytes=self.max_bytes,
             backupCount=self.backup_count,
             encoding="utf-8",
+            # Unencodable text (e.g. lone surrogates) must not cost the record.
+            errors="replace",
         )
         file_handler.setLevel(self.log_level)
-        file_handler.setFormatter(file_formatter)
+        file_handler.setFormatter(
+            _json_formatter() if self.log_json else file_formatter
+        )
+
+        # The file handler runs on a listener thread fed through a queue, so
+        # callers only pay for enqueueing the record.
+        self._queue: queue.Queue[logging.LogRecord] = queue.Queue()
+        self._listener: QueueListener | None = QueueListener(
+            self._queue, file_handler, respect_handler_level=True
+        )
+        self._listener.start()
+
+        # Keep the handlers by role so callers don't have to search for them.
+        self.console_handler = console_handler
+        self.file_handler = file_handler
 
         # Attach the handlers to this logger instance.
         self.addHandler(console_handler)
-        self.addHandler(file_handler)
+        self.addHandler(_RecordQueueHandler(self._queue))
+
+        # Drain the queue and flush the file before logging shuts down.
+        atexit.register(self.close)
+        _LIVE_LOGGERS.add(self)
+
+    def _restart_after_fork(self) -> None:
+        """Give a forked child its own queue and listener thread.
+
+        Threads do not survive a fork, so the inherited listener would never write
+        the child's records. Records still queued in the parent are left to it.
+        """
+        self._queue = queue.Queue()
+        for handler in self.handlers:
+            if isinstance(handler, QueueHandler):
+                handler.queue = self._queue
+        self._listener = QueueListener(
+            self._queue, self.file_handler, respect_handler_level=True
+        )
+        self._listener.start()
+
+    def flush(self) -> None:
+        """Wait until queued records have been written, then flush the log file."""
+        listener = self._listener
+        # Without a running listener thread nothing would ever drain the queue.
+        if (
+            listener is not None
+            and listener._thread is not None
+            and listener._thread.is_alive()
+        ):
+            self._queue.join()
+        self.file_handler.flush()
+
+    def close(self) -> None:
+        """Write any queued records, stop the listener thread and close the log file.
+
+        Records logged afterwards only reach the console, and `get_logger` creates a
+        new logger for this name. Calling this more than once has no further effect.
+        """
+        listener, self._listener = self._listener, None
+        if listener is None:
+            return
+        atexit.unregister(self.close)
+        _LIVE_LOGGERS.discard(self)
+        with _LOGGER_CACHE_LOCK:
+            if _LOGGER_CACHE.get(self.name) is self:
+                del _LOGGER_CACHE[self.name]
+        listener.stop()
+        for handler in self.handlers[:]:
+            if isinstance(handler, QueueHandler):
+                self.removeHandler(handler)
+        self.file_handler.close()
+
+
+# Loggers with a running listener thread, and those being carried across a fork.
+_LIVE_LOGGERS: "weakref.WeakSet[CustomLogger]" = weakref.WeakSet()
+_FORKING: list[CustomLogger] = []
+
+
+def _before_fork() -> None:
+    """Flush each live logger's file and hold its lock until the fork is done.
+
+    Otherwise a forked child inherits the buffered bytes and writes them again.
+    """
+    _FORKING[:] = list(_LIVE_LOGGERS)
+    for logger in _FORKING:
+        logger.file_handler.acquire()
+        logger.file_handler.flush()
+
+
+def _after_fork_in_parent() -> None:
+    """Release the file handler locks taken by _before_fork."""
+    for logger in _FORKING:
+        logger.file_handler.release()
+    _FORKING.clear()
+
+
+def _after_fork_in_child() -> None:
+    """Restart the listener threads of the loggers inherited from the parent.
+
+    The handler locks are reset by `logging` itself, through `_at_fork_reinit`.
+    """
+    for logger in _FORKING:
+        logger._restart_after_fork()
+    _FORKING.clear()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(
+        before=_before_fork,
+        after_in_parent=_after_fork_in_parent,
+        after_in_child=_after_fork_in_child,
+    )
+
+
+# Loggers created through get_logger, by name.
+_LOGGER_CACHE: dict[str, CustomLogger] = {}
+_LOGGER_CACHE_LOCK = threading.Lock()
+
+
+def get_logger(name: str, cfg: "LoggerConfig") -> CustomLogger:
+    """Return the CustomLogger for `name`, creating it on first use.
+
+    Constructing CustomLogger directly always opens a new log file and attaches new
+    handlers. This returns the existing logger when one was already created for
+    `name` (and not closed), in which case `cfg` is ignored.
+
+    Args:
+        name (str): The name of the logger instance.
+        cfg (LoggerConfig): The configuration used if the logger has to be created.
+
+    Returns:
+        CustomLogger: The logger for `name`.
+    """
+    with _LOGGER_CACHE_LOCK:
+        logger = _LOGGER_CACHE.get(name)
+        if logger is None:
+            logger = _LOGGER_CACHE[name] = CustomLogger(name, cfg)
+        return logger
@@ -1,4 +1,6 @@
+import dataclasses
 from pathlib import Path
+from typing import Any
 
 import pytest
 
@@ -40,8 +42,8 @@ def test_logger_config_invalid():
     Test that LoggerConfig raises a LoggerConfigError when the configuration is invalid.
 
     Here, an invalid type is provided for log_dir.
-    The BaseConfig constructor catches the Pydantic ValidationError and re-raises it
-    as a LoggerConfigError with a message prefixed by "Invalid configuration:".
+    The type check in LoggerConfig.__post_init__ raises a LoggerConfigError
+    with a message prefixed by "Invalid configuration:".
     """
     with pytest.raises(LoggerConfigError) as exc_info:
         LoggerConfig(
@@ -64,6 +66,8 @@ def test_logger_config_invalid_log_level(tmp_path: Path):
         )
     # Check that the exception message mentions the log_level validation failure.
     assert "LoggerConfig validation failed for log_level" in str(exc_info.value)
+    # The allowed levels are listed in a stable order.
+    assert "CRITICAL, DEBUG, ERROR, INFO, WARNING" in str(exc_info.value)
 
 
 def test_logger_config_creates_directory(tmp_path: Path):
@@ -90,3 +94,140 @@ def test_logger_config_defaults(tmp_path: Path):
     # Defaults: max_bytes = 1MB, backup_count = 0.
     assert config.max_bytes == 1 * 1024 * 1024
     assert config.backup_count == 0
+
+
+def test_logger_config_from_trusted(tmp_path: Path):
+    """Test that from_trusted normalizes the level and creates the log directory."""
+    log_dir = tmp_path / "trusted_logs"
+    config = LoggerConfig.from_trusted(
+        log_dir=str(log_dir),
+        log_level="info",
+        log_verbose=False,
+    )
+    assert isinstance(config, LoggerConfig)
+    assert config.log_dir == log_dir
+    assert config.log_dir.exists()
+    assert config.log_level == "INFO"
+    assert config.max_bytes == 1 * 1024 * 1024
+    assert config.backup_count == 0
+
+
+def test_logger_config_get_is_cached(tmp_path: Path):
+    """Test that LoggerConfig.get returns one shared instance per set of settings."""
+    log_dir = tmp_path / "cached_logs"
+    first = LoggerConfig.get(log_dir=log_dir, log_level="ERROR", log_verbose=False)
+    second = LoggerConfig.get(
+        log_dir=str(log_dir), log_level="ERROR", log_verbose=False
+    )
+    other = LoggerConfig.get(log_dir=log_dir, log_level="DEBUG", log_verbose=False)
+
+    assert first is second
+    assert other is not first
+    assert first.log_dir.exists()
+
+
+def test_logger_config_get_invalid(tmp_path: Path):
+    """Test that LoggerConfig.get raises LoggerConfigError for invalid settings."""
+    with pytest.raises(LoggerConfigError):
+        LoggerConfig.get(log_dir=tmp_path, log_level="LOUD", log_verbose=False)
+
+
+@pytest.mark.parametrize("log_dir", [None, 15])
+def test_logger_config_get_rejects_non_path_log_dir(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, log_dir: Any
+):
+    """Test that LoggerConfig.get rejects a log_dir that is not a path."""
+    monkeypatch.chdir(tmp_path)
+    with pytest.raises(LoggerConfigError) as exc_info:
+        LoggerConfig.get(log_dir=log_dir, log_level="INFO", log_verbose=True)
+    assert "log_dir must be a path" in str(exc_info.value)
+    assert not (tmp_path / str(log_dir)).exists()
+
+
+def test_logger_config_get_rejects_bool_int_mixing(tmp_path: Path):
+    """Test that LoggerConfig.get does not match 1/True to a cached configuration."""
+    settings: dict[str, Any] = {"log_dir": tmp_path, "log_level": "INFO"}
+    LoggerConfig.get(**settings, log_verbose=True, max_bytes=1)
+    with pytest.raises(LoggerConfigError) as exc_info:
+        LoggerConfig.get(**settings, log_verbose=True, max_bytes=True)
+    assert "max_bytes must be an integer" in str(exc_info.value)
+    verbose: Any = 1
+    with pytest.raises(LoggerConfigError) as exc_info:
+        LoggerConfig.get(**settings, log_verbose=verbose, max_bytes=1)
+    assert "log_verbose must be a boolean" in str(exc_info.value)
+
+
+def test_logger_config_converts_path_and_is_hashable(tmp_path: Path):
+    """Test that string paths are converted and configs can be used as cache keys."""
+    config = LoggerConfig.build(
+        log_dir=str(tmp_path), log_level="INFO", log_verbose=False
+    )
+    # String paths are converted to Path.
+    assert config.log_dir == tmp_path
+    assert hash(config) == hash(
+        LoggerConfig(log_dir=tmp_path, log_level="info", log_verbose=False)
+    )
+
+
+def test_logger_config_build_rejects_unknown_settings(tmp_path: Path):
+    """Test that LoggerConfig.build reports unknown settings as LoggerConfigError."""
+    with pytest.raises(LoggerConfigError) as exc_info:
+        LoggerConfig.build(
+            log_dir=tmp_path, log_level="INFO", log_verbose=False, colour=True
+        )
+    assert "Invalid configuration:" in str(exc_info.value)
+
+
+def test_logger_config_rejects_bool_for_int(tmp_path: Path):
+    """Test that a boolean is not accepted for an integer setting."""
+    with pytest.raises(LoggerConfigError) as exc_info:
+        LoggerConfig(
+            log_dir=tmp_path, log_level="INFO", log_verbose=False, max_bytes=True
+        )
+    assert "max_bytes must be an integer" in str(exc_info.value)
+
+
+def test_logger_config_from_env(tmp_path: Path):
+    """Test that LoggerConfig.from_env parses typed values from string variables."""
+    log_dir = tmp_path / "env_logs"
+    config = LoggerConfig.from_env(
+        {
+            "LOG_DIR": str(log_dir),
+            "LOG_LEVEL": "warning",
+            "LOG_VERBOSE": "True",
+            "LOG_MAX_BYTES": "2048",
+            "LOG_BACKUP_COUNT": " 3 ",
+        }
+    )
+    assert config.log_dir == log_dir
+    assert log_dir.exists()
+    assert config.log_level == "WARNING"
+    assert config.log_verbose is True
+    assert config.max_bytes == 2048
+    assert config.backup_count == 3
+
+
+def test_logger_config_from_env_invalid(tmp_path: Path):
+    """Test that unparsable or missing variables raise LoggerConfigError."""
+    with pytest.raises(LoggerConfigError) as exc_info:
+        LoggerConfig.from_env(
+            {"LOG_DIR": str(tmp_path), "LOG_LEVEL": "INFO", "LOG_VERBOSE": "maybe"}
+        )
+    assert "LoggerConfig validation failed for LOG_VERBOSE" in str(exc_info.value)
+
+    with pytest.raises(LoggerConfigError) as exc_info:
+        LoggerConfig.from_env({"LOG_LEVEL": "INFO", "LOG_VERBOSE": "0"})
+    assert "log_dir" in str(exc_info.value)
+
+
+def test_logger_config_is_immutable(tmp_path: Path):
+    """Test that settings cannot be reassigned and replace() builds a validated copy."""
+    config = LoggerConfig(log_dir=tmp_path, log_level="INFO", log_verbose=False)
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        config.log_level = "x"  # type: ignore[misc]
+
+    updated = dataclasses.replace(config, log_level="error")
+    assert updated.log_level == "ERROR"
+    assert config.log_level == "INFO"
+    with pytest.raises(LoggerConfigError):
+        dataclasses.replace(config, log_level="x")
@@ -1,14 +1,26 @@
+import io
+import json
 import logging
-import re
+import os
+import signal
+import sys
+import time
 from io import StringIO
 from logging import StreamHandler
-from logging.handlers import RotatingFileHandler
+from logging.handlers import QueueHandler, RotatingFileHandler
 from pathlib import Path
 
 import pytest
 
 from logger.config import LoggerConfig
-from logger.custom_logger import ColoredFormatter, CustomLogger
+from logger.custom_logger import (
+    BufferedRotatingFileHandler,
+    ColoredFormatter,
+    CustomLogger,
+    FastFormatter,
+    StructuredJsonFormatter,
+    get_logger,
+)
 
 
 # Fixture to set up environment variables and a temporary log directory.
@@ -19,36 +31,134 @@ def temp_log_dir(tmp_path):
     return log_dir
 
 
+# Fixture providing the logger settings as environment variables.
+@pytest.fixture
+def log_env(temp_log_dir):
+    return {
+        "LOG_DIR": str(temp_log_dir),
+        "LOG_LEVEL": "DEBUG",
+        "LOG_VERBOSE": "true",
+        "LOG_MAX_BYTES": "1024",  # 1 KB for testing rotation.
+        "LOG_BACKUP_COUNT": "2",
+    }
+
+
 # Fixture to create a CustomLogger instance.
 @pytest.fixture
-def custom_logger(tmp_path):
+def custom_logger(log_env):
     # Instantiate the custom logger with a test name.
-    test_cfg = LoggerConfig(
-        log_dir=tmp_path / "logs",
-        log_level="DEBUG",
-        log_verbose=True,
-        max_bytes=1024,  # 1 KB for testing rotation.
-        backup_count=2,
-    )
+    test_cfg = LoggerConfig.from_env(log_env)
     logger = CustomLogger("test_logger", test_cfg)
     yield logger  # Keep the log file for the test session
+    logger.close()  # Stop the listener thread and close the log file.
     logger.log_file.unlink()  # Remove the default log file created by the logger.
 
 
-def test_custom_logger_configuration(custom_logger):
+# Fixture to create a CustomLogger whose file handler writes to memory.
+# The console only gets colors on a TTY, and pytest captures stderr, so
+# stderr reports being a terminal while the logger is built.
+@pytest.fixture
+def mem_logger(log_env, monkeypatch):
+    monkeypatch.setattr(sys.stderr, "isatty", lambda: True)
+    test_cfg = LoggerConfig.from_env(log_env)
+    logger = CustomLogger("test_mem_logger", test_cfg)
+    file_handler = logger.file_handler
+    # Swap the log file for an in-memory buffer so records never reach the disk.
+    file_handler.acquire()
+    try:
+        file_handler.stream.close()
+        file_handler.stream = io.BufferedWriter(io.BytesIO())
+    finally:
+        file_handler.release()
+    yield logger
+    logger.close()
+
+
+def test_custom_logger_configuration(mem_logger):
     """
     Verify that the CustomLogger instance is initialized with:
       - The correct log level.
-      - Exactly two handlers (a StreamHandler and a RotatingFileHandler).
+      - Exactly two handlers (a StreamHandler and a QueueHandler).
+      - A RotatingFileHandler served by the queue listener.
       - Propagation disabled.
     """
-    assert custom_logger.level == logging.DEBUG
-    assert not custom_logger.propagate
-    assert len(custom_logger.handlers) == 2
+    assert mem_logger.level == logging.DEBUG
+    assert not mem_logger.propagate
+    assert len(mem_logger.handlers) == 2
+
+    types_seen = tuple(type(handler) for handler in mem_logger.handlers)
+    assert any(issubclass(t, StreamHandler) for t in types_seen)
+    assert any(issubclass(t, QueueHandler) for t in types_seen)
+
+    assert mem_logger.console_handler in mem_logger.handlers
+    assert mem_logger._listener.handlers == (mem_logger.file_handler,)
+    assert isinstance(mem_logger.file_handler, RotatingFileHandler)
+
+
+def test_loggers_share_formatters(tmp_path):
+    """
+    Verify that separate CustomLogger instances reuse the same formatter objects.
+    """
+    loggers = [
+        CustomLogger(
+            f"shared_{i}",
+            LoggerConfig(log_dir=tmp_path / str(i), log_level="INFO", log_verbose=True),
+        )
+        for i in range(2)
+    ]
+    try:
+        first, second = (
+            [handler.formatter for handler in logger.handlers] for logger in loggers
+        )
+        assert first[0] is second[0]
+        assert loggers[0].file_handler.formatter is loggers[1].file_handler.formatter
+    finally:
+        for logger in loggers:
+            logger.close()
+
+
+def test_logger_layout_includes_location(tmp_path):
+    """
+    Verify that verbose and non-verbose loggers both include the logger name and
+    line number in their records.
+    """
+    quiet = CustomLogger(
+        "quiet_logger",
+        LoggerConfig(log_dir=tmp_path / "quiet", log_level="INFO", log_verbose=False),
+    )
+    loud = CustomLogger(
+        "loud_logger",
+        LoggerConfig(log_dir=tmp_path / "loud", log_level="INFO", log_verbose=True),
+    )
+    try:
+        record = logging.makeLogRecord(
+            {"msg": "Located", "name": "pkg.mod", "lineno": 7, "levelname": "INFO"}
+        )
+        for logger in (quiet, loud):
+            line = logger.file_handler.format(record)
+            assert line.endswith(" [INFO] pkg.mod:7: Located")
+    finally:
+        quiet.close()
+        loud.close()
+
+
+def test_get_logger_reuses_logger(tmp_path):
+    """
+    Verify that get_logger returns the same logger for a name until it is closed.
+    """
+    cfg = LoggerConfig(log_dir=tmp_path / "logs", log_level="INFO", log_verbose=True)
+    logger = get_logger("test_get_logger", cfg)
+    try:
+        assert get_logger("test_get_logger", cfg) is logger
+        assert len(logger.handlers) == 2
+    finally:
+        logger.close()
 
-    handler_types = {type(handler) for handler in custom_logger.handlers}
-    assert StreamHandler in handler_types
-    assert RotatingFileHandler in handler_types
+    replacement = get_logger("test_get_logger", cfg)
+    try:
+        assert replacement is not logger
+    finally:
+        replacement.close()
 
 
 def test_colored_formatter_output():
@@ -67,30 +177,218 @@ def test_colored_formatter_output():
         exc_info=None,
     )
     output = formatter.format(record)
-    # Check that ANSI escape sequences for red and reset are present.
+    # Check that the level name is wrapped in the red and reset sequences.
     assert "\033[91m" in output
     assert "\033[0m" in output
+    assert output.startswith("\033[91mERROR\033[0m: ")
     # Verify that the log message is present.
     assert "An error occurred" in output
 
 
-def test_console_logging_output(custom_logger, monkeypatch):
+def test_colored_formatter_unknown_level():
+    """
+    Verify that a level without a configured color is rendered as its plain name.
+    """
+    formatter = ColoredFormatter("%(levelname_colored)s: %(message)s")
+    record = logging.LogRecord(
+        name="test",
+        level=logging.INFO,
+        pathname="",
+        lineno=0,
+        msg="Custom level",
+        args=(),
+        exc_info=None,
+    )
+    record.levelname = "TRACE"
+    assert formatter.format(record) == "TRACE: Custom level"
+
+
+def test_fast_formatter_matches_standard_formatter():
+    """
+    Verify that FastFormatter produces the same output as logging.Formatter
+    for the same format string.
+    """
+    fmt = "%(asctime)s [%(levelname)s] %(name)s:%(lineno)d: %(message)s"
+    record = logging.LogRecord(
+        name="test",
+        level=logging.WARNING,
+        pathname="",
+        lineno=42,
+        msg="Value is %d",
+        args=(7,),
+        exc_info=None,
+    )
+    assert FastFormatter(fmt).format(record) == logging.Formatter(fmt).format(record)
+
+
+@pytest.mark.parametrize(
+    "fmt, style, defaults",
+    [
+        ("{levelname}: {message} ({user})", "{", {"user": "anon"}),
+        ("$levelname: $message ($user)", "$", {"user": "anon"}),
+        ("%(levelname)s: %(message)s (%(user)s)", "%", {"user": "anon"}),
+    ],
+)
+def test_formatters_accept_formatter_options(fmt, style, defaults):
+    """
+    Verify that FastFormatter and ColoredFormatter accept the same style and
+    defaults options as logging.Formatter and format records the same way.
+    """
+    record = logging.makeLogRecord(
+        {"msg": "Value is %d", "args": (7,), "levelname": "WARNING"}
+    )
+    expected = logging.Formatter(fmt, style=style, defaults=defaults).format(record)
+    assert expected == "WARNING: Value is 7 (anon)"
+    for cls in (FastFormatter, ColoredFormatter):
+        formatter = cls(fmt, style=style, validate=True, defaults=defaults)
+        assert formatter.format(record) == expected
+
+
+def test_fast_formatter_includes_exception():
+    """
+    Verify that FastFormatter appends tracebacks like logging.Formatter.
+    """
+    fmt = "[%(levelname)s] %(message)s"
+    try:
+        raise ValueError("boom")
+    except ValueError:
+        record = logging.makeLogRecord(
+            {"msg": "Failed", "levelname": "ERROR", "exc_info": sys.exc_info()}
+        )
+    output = FastFormatter(fmt).format(record)
+    assert output.startswith("[ERROR] Failed\nTraceback")
+    assert output == logging.Formatter(fmt).format(record)
+
+
+def test_fast_formatter_skips_unused_time():
+    """
+    Verify that FastFormatter only formats the creation time when its format
+    string uses it.
+    """
+    assert FastFormatter("%(asctime)s %(message)s").usesTime()
+    formatter = FastFormatter("%(levelname)s: %(message)s")
+    assert not formatter.usesTime()
+    record = logging.makeLogRecord({"msg": "no time", "levelname": "INFO"})
+    assert formatter.format(record) == "INFO: no time"
+    assert not hasattr(record, "asctime")
+
+
+def test_fast_formatter_time_cache():
+    """
+    Verify that FastFormatter formats times like logging.Formatter when several
+    records fall within the same second and when the second changes.
+    """
+    fmt = "%(asctime)s %(message)s"
+    fast = FastFormatter(fmt)
+    standard = logging.Formatter(fmt)
+    for created in (1700000000.125, 1700000000.987, 1700000001.5):
+        record = logging.makeLogRecord({"msg": "tick", "created": created})
+        record.msecs = int((created - int(created)) * 1000)
+        assert fast.format(record) == standard.format(record)
+
+
+def test_structured_json_formatter_output():
+    """
+    Verify that the StructuredJsonFormatter renders a record as one JSON object.
+    """
+    record = logging.LogRecord(
+        name="test",
+        level=logging.INFO,
+        pathname="",
+        lineno=12,
+        msg="Processed %d items",
+        args=(3,),
+        exc_info=None,
+    )
+    output = StructuredJsonFormatter().format(record)
+    assert "\n" not in output
+    assert json.loads(output) == {
+        "ts": record.created,
+        "lvl": "INFO",
+        "name": "test",
+        "line": 12,
+        "msg": "Processed 3 items",
+    }
+
+
+def test_json_file_logging_output(tmp_path):
+    """
+    Verify that a logger configured with log_json writes JSON lines to its file.
+    """
+    cfg = LoggerConfig(
+        log_dir=tmp_path / "logs", log_level="INFO", log_verbose=True, log_json=True
+    )
+    logger = CustomLogger("test_json_logger", cfg)
+    try:
+        logger.warning("Structured %s", "entry")
+        logger.flush()
+        lines = logger.log_file.read_text(encoding="utf-8").splitlines()
+    finally:
+        logger.close()
+    assert len(lines) == 1
+    entry = json.loads(lines[0])
+    assert entry["lvl"] == "WARNING"
+    assert entry["msg"] == "Structured entry"
+
+
+def test_json_file_logging_exception(tmp_path):
+    """
+    Verify that a JSON logger writes tracebacks and stacks under their own keys
+    instead of folding them into the message.
+    """
+    cfg = LoggerConfig(
+        log_dir=tmp_path / "logs", log_level="INFO", log_verbose=True, log_json=True
+    )
+    logger = CustomLogger("test_json_exception_logger", cfg)
+    try:
+        try:
+            raise ValueError("bad value")
+        except ValueError:
+            logger.exception("boom %s", 1)
+        logger.info("Where am I", stack_info=True)
+        logger.flush()
+        lines = logger.log_file.read_text(encoding="utf-8").splitlines()
+    finally:
+        logger.close()
+    assert len(lines) == 2
+    failure, located = (json.loads(line) for line in lines)
+    assert failure["msg"] == "boom 1"
+    assert failure["exc"].startswith("Traceback (most recent call last):")
+    assert "ValueError: bad value" in failure["exc"]
+    assert located["msg"] == "Where am I"
+    assert located["stack"].startswith("Stack (most recent call last):")
+    assert "exc" not in located
+
+
+def test_file_logging_keeps_exception(custom_logger):
+    """
+    Verify that the plain-text log file still includes the traceback after the
+    message.
+    """
+    try:
+        raise ValueError("bad value")
+    except ValueError:
+        custom_logger.exception("boom %s", 1)
+    custom_logger.flush()
+
+    content = Path(custom_logger.log_file).read_text(encoding="utf-8")
+    assert "boom 1\nTraceback (most recent call last):" in content
+    assert "ValueError: bad value" in content
+
+
+def test_console_logging_output(mem_logger, monkeypatch):
     """
     Verify that the console (StreamHandler) logs messages with ANSI color codes.
     This is done by replacing the handler's stream with a StringIO and checking the output.
     """
-    # Identify the console handler.
-    console_handler = next(
-        (h for h in custom_logger.handlers if isinstance(h, StreamHandler)), None
-    )
-    assert console_handler is not None
+    console_handler = mem_logger.console_handler
 
     # Replace its stream with a StringIO for capturing output.
     stream = StringIO()
     console_handler.stream = stream
 
     # Log a test message.
-    custom_logger.info("Test console log")
+    mem_logger.info("Test console log")
     console_handler.flush()
     output = stream.getvalue()
 
@@ -99,35 +397,257 @@ def test_console_logging_output(custom_logger, monkeypatch):
     assert "Test console log" in output
 
 
+def test_console_plain_when_not_a_tty(tmp_path, monkeypatch):
+    """
+    Verify that the console handler leaves out ANSI color codes when stderr is
+    not a terminal.
+    """
+    monkeypatch.setattr(sys.stderr, "isatty", lambda: False)
+    logger = CustomLogger(
+        "plain_console_logger",
+        LoggerConfig(log_dir=tmp_path / "logs", log_level="INFO", log_verbose=True),
+    )
+    try:
+        stream = StringIO()
+        logger.console_handler.stream = stream
+        logger.info("Redirected console log")
+        output = stream.getvalue()
+        assert "[INFO]" in output
+        assert "\x1b[" not in output
+    finally:
+        logger.close()
+
+
+def test_level_methods_report_caller_line(custom_logger):
+    """
+    Verify that records logged through the level methods carry the caller's
+    file and line number, and that records below the logger's level are dropped.
+    """
+    records = []
+    handler = logging.Handler()
+    handler.emit = records.append  # type: ignore[method-assign]
+    custom_logger.addHandler(handler)
+    try:
+        custom_logger.setLevel(logging.INFO)
+        custom_logger.debug("Dropped")
+        custom_logger.info("Kept")
+        expected_line = sys._getframe().f_lineno - 1
+    finally:
+        custom_logger.removeHandler(handler)
+
+    assert [record.getMessage() for record in records] == ["Kept"]
+    assert records[0].lineno == expected_line
+    assert records[0].pathname == __file__
+
+
 def test_file_logging_output(custom_logger):
     """
     Verify that the file (RotatingFileHandler) logs messages using the standard formatter
     (i.e., without ANSI escape codes). Read the log file and check the contents.
     """
-    # Log a test message.
+    # Log a test message and wait for it to reach the file.
     custom_logger.warning("Test file log")
+    custom_logger.flush()
 
     # Get the file path from the logger.
     log_file = Path(custom_logger.log_file)
     # Ensure the log file exists.
     assert log_file.exists()
 
-    # Read the file content.
-    content = log_file.read_text(encoding="utf-8")
+    # Read the raw file content.
+    content = log_file.read_bytes()
     # Check that the plain log level "WARNING" appears.
-    assert "WARNING" in content
+    assert b"WARNING" in content
     # Verify that there are no ANSI escape codes.
-    ansi_escape = re.compile(r"\x1B\[[0-?]*[ -/]*[@-~]")
-    assert not ansi_escape.search(content)
+    assert b"\x1b[" not in content
+
+
+@pytest.mark.skipif(not hasattr(os, "fork"), reason="requires os.fork")
+@pytest.mark.filterwarnings("ignore:This process .* is multi-threaded")
+def test_file_logging_after_fork(custom_logger):
+    """
+    Verify that a forked child's records reach the log file, and that records
+    buffered before the fork are written only once.
+    """
+    custom_logger.warning("Before fork")
+    pid = os.fork()
+    if pid == 0:  # pragma: no cover - runs in the child process.
+        status = 1
+        try:
+            # Kill the child rather than hang the test if flush() blocks.
+            signal.alarm(5)
+            custom_logger.warning("From child")
+            custom_logger.flush()
+            status = 0
+        finally:
+            os._exit(status)
+    _, status = os.waitpid(pid, 0)
+    assert os.waitstatus_to_exitcode(status) == 0
+
+    custom_logger.flush()
+    content = Path(custom_logger.log_file).read_text(encoding="utf-8")
+    assert content.count("Before fork") == 1
+    assert "From child" in content
+
+
+def test_file_logging_replaces_unencodable_text(custom_logger):
+    """
+    Verify that text which cannot be encoded as UTF-8 is replaced in the log
+    file rather than dropping the record.
+    """
+    custom_logger.warning("Lone surrogate \udc80 here")
+    custom_logger.flush()
+
+    content = Path(custom_logger.log_file).read_bytes()
+    assert b"Lone surrogate ? here" in content
+
 
+def test_json_file_logging_replaces_unencodable_text(tmp_path):
+    """
+    Verify that a JSON logger keeps records whose text cannot be encoded as
+    UTF-8, replacing the offending characters.
+    """
+    cfg = LoggerConfig(
+        log_dir=tmp_path / "logs", log_level="INFO", log_verbose=True, log_json=True
+    )
+    logger = CustomLogger("test_json_surrogate_logger", cfg)
+    try:
+        logger.warning("Lone surrogate \udc80 here")
+        logger.flush()
+        lines = logger.log_file.read_text(encoding="utf-8").splitlines()
+    finally:
+        logger.close()
+    assert len(lines) == 1
+    assert json.loads(lines[0])["msg"] == "Lone surrogate ? here"
 
-def test_rotating_file_handler_config(custom_logger):
+
+def test_rotating_file_handler_config(mem_logger):
     """
     Verify that the RotatingFileHandler is configured with the correct maxBytes and backupCount.
     """
-    file_handler = next(
-        (h for h in custom_logger.handlers if isinstance(h, RotatingFileHandler)), None
+    file_handler = mem_logger.file_handler
+    assert file_handler.maxBytes == mem_logger.max_bytes
+    assert file_handler.backupCount == mem_logger.backup_count
+
+
+def test_buffered_file_handler_flushes_on_error(tmp_path):
+    """
+    Verify that the BufferedRotatingFileHandler holds records below ERROR in its
+    buffer and writes them out as soon as an ERROR record is emitted.
+    """
+    log_file = tmp_path / "buffered.log"
+    handler = BufferedRotatingFileHandler(str(log_file), encoding="utf-8")
+    try:
+        logger = logging.getLogger("test_buffered_file_handler")
+        logger.propagate = False
+        logger.addHandler(handler)
+
+        logger.warning("Buffered record")
+        assert log_file.read_text(encoding="utf-8") == ""
+
+        logger.error("Flushing record")
+        content = log_file.read_text(encoding="utf-8")
+        assert "Buffered record" in content
+        assert "Flushing record" in content
+    finally:
+        logger.removeHandler(handler)
+        handler.close()
+
+
+def test_buffered_file_handler_periodic_flush(tmp_path):
+    """
+    Verify that the BufferedRotatingFileHandler flushes buffered records on its
+    timer and stops the timer when closed.
+    """
+    log_file = tmp_path / "periodic.log"
+    handler = BufferedRotatingFileHandler(
+        str(log_file), encoding="utf-8", flush_interval=0.05
+    )
+    try:
+        record = logging.makeLogRecord({"msg": "Timed record", "levelno": logging.INFO})
+        handler.handle(record)
+        deadline = time.monotonic() + 5
+        while not log_file.read_text(encoding="utf-8") and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert log_file.read_text(encoding="utf-8") == "Timed record\n"
+    finally:
+        handler.close()
+    assert handler._timer is None
+
+
+def test_buffered_file_handler_rollover(tmp_path):
+    """
+    Verify that the BufferedRotatingFileHandler rolls the file over once the
+    tracked size would exceed maxBytes.
+    """
+    log_file = tmp_path / "rolling.log"
+    handler = BufferedRotatingFileHandler(
+        str(log_file), maxBytes=64, backupCount=1, encoding="utf-8"
+    )
+    try:
+        for i in range(4):
+            record = logging.makeLogRecord(
+                {"msg": f"record {i:02d} " * 2, "levelno": logging.INFO}
+            )
+            handler.handle(record)
+    finally:
+        handler.close()
+
+    assert (tmp_path / "rolling.log.1").exists()
+    assert log_file.stat().st_size <= 64
+
+
+def test_buffered_file_handler_tracks_encoded_size(tmp_path):
+    """
+    Verify that the BufferedRotatingFileHandler counts encoded bytes, so its
+    tracked size matches the file on disk for non-ASCII messages.
+    """
+    log_file = tmp_path / "encoded.log"
+    handler = BufferedRotatingFileHandler(str(log_file), encoding="utf-8")
+    try:
+        record = logging.makeLogRecord({"msg": "größe ✓", "levelno": logging.ERROR})
+        handler.handle(record)
+        assert log_file.read_text(encoding="utf-8") == "größe ✓\n"
+        assert handler._size == log_file.stat().st_size
+    finally:
+        handler.close()
+
+
+def test_buffered_file_handler_should_rollover_uses_tracked_size(tmp_path, monkeypatch):
+    """
+    Verify that shouldRollover answers from the tracked size without touching
+    the file system.
+    """
+    log_file = tmp_path / "tracked.log"
+    handler = BufferedRotatingFileHandler(
+        str(log_file), maxBytes=16, encoding="utf-8", flush_interval=None
     )
-    assert file_handler is not None
-    assert file_handler.maxBytes == custom_logger.max_bytes
-    assert file_handler.backupCount == custom_logger.backup_count
+    try:
+        record = logging.makeLogRecord({"msg": "0123456789", "levelno": logging.INFO})
+
+        def fail(*args, **kwargs):
+            raise AssertionError("shouldRollover touched the file system")
+
+        monkeypatch.setattr("os.stat", fail)
+        monkeypatch.setattr("os.fstat", fail)
+        assert not handler.shouldRollover(record)
+        handler._size = 10
+        assert handler.shouldRollover(record)
+    finally:
+        monkeypatch.undo()
+        handler.close()
+
+
+def test_buffered_file_handler_does_not_reopen_after_close(tmp_path):
+    """
+    Verify that the BufferedRotatingFileHandler drops records emitted after it
+    has been closed instead of reopening the file.
+    """
+    log_file = tmp_path / "closed.log"
+    handler = BufferedRotatingFileHandler(str(log_file), encoding="utf-8")
+    handler.handle(logging.makeLogRecord({"msg": "open", "levelno": logging.INFO}))
+    handler.close()
+
+    handler.handle(logging.makeLogRecord({"msg": "closed", "levelno": logging.INFO}))
+    assert handler.stream is None
+    assert log_file.read_text(encoding="utf-8") == "open\n"